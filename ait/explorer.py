@@ -7,6 +7,7 @@
 """
 
 import logging
+import sys
 
 from ait.interface import Event, State, Transition, SUT, Validator
 from ait.errors import UnknownEvent, UnknownState
@@ -14,6 +15,20 @@ from ait.graph_wrapper import Arrow, GraphWrapper
 from ait.utils import shortest_path
 
 
+def _intern(name):
+    """
+    Intern a name used as a key of the hot lookups. Only an exact str can be
+    interned, any other name is returned as is so the key always equals the
+    name it is looked up with.
+
+    :param name: the name of a state or an event
+    :type name: str
+    :return: the interned name, or the name itself
+    :rtype: str
+    """
+    return sys.intern(name) if type(name) is str else name
+
+
 class Explorer:
     """StateEngine class"""
 
@@ -34,11 +49,23 @@ class Explorer:
         self._state_matrix = {}
         self._state_machine = GraphWrapper()
         self._sut = sut
-        self._event_list = event_list
+        # the names are interned as they are the keys of the hot lookups
+        self._event_list = {_intern(name): event for name, event in event_list.items()}
+        # template of the transitions of a new state, copied in _add_state
+        self._empty_transitions = dict.fromkeys(self._event_list)
+        # names of the states which still have undetermined transitions
+        self._immature_states: set[str] = set()
+        # the events have not been exercised on each state
+        self._untaken: dict[str, dict[str, Event]] = {}
+        # total number of undetermined transitions in the matrix
+        self._pending_total = 0
+        # BFS order of the state graph from a state, reset when an arc is added
+        self._bfs_cache: dict[str, list[str]] = {}
+        # shortest paths between two states, reset when an arc is added
+        self._path_cache: dict[tuple[str, str], list[Arrow]] = {}
         self._validators = validators or []
         self._initial_state = sut.state
         self._add_state(self._initial_state)
-        self._max_paths = pow(len(event_list), 3)
 
     @property
     def maze(self) -> dict[str, dict[str, State | dict[str, State]]]:
@@ -86,7 +113,8 @@ class Explorer:
         current_state = state  # the state to start exploring
 
         generation = 0
-        while not self._mature():
+        last_progress = None  # the snapshot of the previous iteration
+        while self._immature_states:
             # select a state to explore
             # if the current state is immature, explore the current state
             # otherwise find a immature state that needs least step to reach
@@ -98,23 +126,32 @@ class Explorer:
                 current_state,
             )
             source = self._go_to_nearest_immature_state(current_state.name)
-            current_state = self._discover(self._get_state(source))
-            generation += 1
-            if generation > self._max_paths:
+            if not source:
+                logging.warning(
+                    "No immature state is reachable from %s, stop exploring.",
+                    current_state.name,
+                )
+                break
+            progress = (source, len(self._state_matrix), self._pending_total)
+            if progress == last_progress:
+                # nothing changed since the last iteration, it won't converge
                 logging.warning(
-                    "The state machine is too complicated or something wrong."
+                    "No new transition is discovered from %s, stop exploring.",
+                    source,
                 )
+                break
+            last_progress = progress
+            current_state = self._discover(self._get_state(source))
+            generation += 1
 
     def _is_mature_state(self, name: str) -> bool:
-        try:
-            trans = self.maze[name]["transitions"]
-            return not None in trans.values()
-        except KeyError as exc:
-            logging.warning("State % does not exist", name)
-            raise UnknownState from exc
+        if name not in self._state_matrix:
+            logging.warning("State %s does not exist", name)
+            raise UnknownState(f"Invalid state {name}")
+        return name not in self._immature_states
 
     def _get_immature_states(self) -> list[str]:
-        return [name for name in self._state_matrix if not self._is_mature_state(name)]
+        return list(self._immature_states)
 
     def _mature(self, name: str = "") -> bool:
         """
@@ -131,11 +168,7 @@ class Explorer:
         if name:
             return self._is_mature_state(name)
 
-        for row in self._state_matrix.values():
-            if None in row["transitions"].values():
-                return False
-
-        return True
+        return self._pending_total == 0
 
     def _add_state(self, state: State):
         """Add a state and initialize the transitions to None if it is new
@@ -143,18 +176,24 @@ class Explorer:
         :param new_state: the new state
         :type new_state: State
         """
-        if not state.is_valid:
+        if state.name in self._state_matrix or not state.is_valid:
             return
 
-        if not self._get_state(state.name):
-            transitions = {name: None for name in self._event_list}
-            self._state_matrix[state.name] = {
-                "source": state,
-                "transitions": transitions,
-            }
-            logging.info("Add new state: %s", state)
-
-            self._state_machine.add_node(state.name, state.value)
+        # intern the key of the hot lookups only, the state belongs to the
+        # caller and is not modified
+        name = _intern(state.name)
+        transitions = self._empty_transitions.copy()
+        self._state_matrix[name] = {
+            "source": state,
+            "transitions": transitions,
+        }
+        if transitions:
+            self._untaken[name] = self._event_list.copy()
+            self._pending_total += len(transitions)
+            self._immature_states.add(name)
+        logging.info("Add new state: %s", state)
+
+        self._state_machine.add_node(name, state.value)
 
     def _get_state(self, state_name: str) -> State:
         """Get a state by name
@@ -164,10 +203,8 @@ class Explorer:
         :return: the state object if found in the state list, otherwise None
         :rtype: State
         """
-        try:
-            return self._state_matrix[state_name]["source"]
-        except KeyError:
-            return None
+        row = self._state_matrix.get(state_name)
+        return row["source"] if row else None
 
     def _set_transition(self, transition: Transition):
         """
@@ -192,6 +229,11 @@ class Explorer:
             old_state = trans[event_name]
             if not old_state:
                 trans[event_name] = transition.target
+                untaken = self._untaken[source_name]
+                del untaken[event_name]
+                self._pending_total -= 1
+                if not untaken:
+                    self._immature_states.discard(source_name)
                 if transition.source.is_valid and transition.target.is_valid:
                     # add the transition into the state graph if both states are real
                     self._state_machine.add_arc(
@@ -205,6 +247,8 @@ class Explorer:
                         event_detail=transition.event.value,
                         transition_result=transition.output,
                     )
+                    self._bfs_cache.clear()
+                    self._path_cache.clear()
                 logging.info("Add new transition %s", transition)
                 return
             if old_state != transition.target:
@@ -226,43 +270,39 @@ class Explorer:
         """
         Explore possible transitions on a state by applying all the events on it.
         If any event triggers the target system state change, the function will
-        recursively exploring the new state until get a mature state.
+        continue exploring the new state until get a mature state.
         The returned state might be the same as the original state if all the
         events are exercised or there is a circuit.
 
         :param current_state: the current state
         :type current_state: State
-        :raises UnknownEvent: if the event in the event list of the matrix but
-                              not in the state's dictionary
-        :raises UnknownEvent: if the event is not in the matrix
+        :raises UnknownEvent: if the state is not in the matrix
         :return: a mature state where all the events are exercised.
         :rtype: State
         """
-        if not isinstance(current_state, State):
-            logging.warning("Wrong object %s", current_state)
-            raise UnknownEvent
-
-        if current_state.name not in self._state_matrix:
-            logging.error("State %s does not exist", current_state.name)
-            raise UnknownEvent(f"Invalid state {current_state.name}")
-
-        if self._is_mature_state(current_state.name):
-            return current_state
-
-        for event in self._event_list.values():
-            try:
-                target_state = self._state_matrix[current_state.name]["transitions"][
-                    event.name
-                ]
-                if target_state:
-                    # the event on current state has been exercised, skip it
-                    continue
-
-                output = event.fire(self._sut)
-                target_state = self._sut.state
-                self._set_transition(
-                    Transition(current_state, target_state, event, output)
-                )
+        while True:
+            if not isinstance(current_state, State):
+                logging.warning("Wrong object %s", current_state)
+                raise UnknownEvent
+
+            if current_state.name not in self._state_matrix:
+                logging.error("State %s does not exist", current_state.name)
+                raise UnknownEvent(f"Invalid state {current_state.name}")
+
+            if self._is_mature_state(current_state.name):
+                return current_state
+
+            next_state = None
+            set_transition = self._set_transition
+            # copy the events as they are removed while recording the transitions
+            events = list(self._untaken[current_state.name].values())
+
+            # the batch stops at the first event leaves the current state, the
+            # transitions are recorded and validated after the batch returns
+            for event, (output, target_state) in zip(
+                events, self._sut.fire_batch(events, current_state)
+            ):
+                set_transition(Transition(current_state, target_state, event, output))
                 if current_state != target_state:
                     # the target system goes to a new state by the event
                     # explore the transitions on the next state
@@ -272,24 +312,23 @@ class Explorer:
                         event.name,
                         current_state.name,
                     )
-                    return self._discover(target_state)
-            except KeyError as exc:
-                raise UnknownEvent(f"Invalid event {event.name}") from exc
+                    next_state = target_state
+                    break
 
-        return current_state
+            if next_state is None:
+                return current_state
+            current_state = next_state
 
     def _go_to_nearest_immature_state(self, source: str) -> str:
         if not self._is_mature_state(source):
             return source
 
-        path1 = list(
-            range(len(self._state_matrix))
-        )  # from source to the nearest immature state
-        path2 = path1.copy()  # from initial state to the nearest immature state
+        path1 = None  # from source to the nearest immature state
+        path2 = None  # from initial state to the nearest immature state
 
         target = self._find_nearest_immature_state(source)
         if target:
-            path1 = shortest_path(self._state_machine.graph, source, target)
+            path1 = self._shortest_path(source, target)
         if source != self._initial_state.name:
             # try start from initial state
             if not self._is_mature_state(self._initial_state.name):
@@ -297,18 +336,35 @@ class Explorer:
                 return self._initial_state.name
 
             target = self._find_nearest_immature_state(self._initial_state.name)
-            # there must be an immature state reachable from the initial state
-            path2 = shortest_path(
-                self._state_machine.graph, self._initial_state.name, target
-            )
+            if target:
+                path2 = self._shortest_path(self._initial_state.name, target)
 
-        if len(path1) <= len(path2):
-            # go from current state
-            return self._execute_path(path1)
+        if path2 is None or (path1 is not None and len(path1) <= len(path2)):
+            # go from current state, no path means no reachable immature state
+            return self._execute_path(path1 or [])
 
         self._sut.reset()  # go to initial state first
         return self._execute_path(path2)
 
+    def _shortest_path(self, source: str, target: str) -> list[Arrow]:
+        """
+        Get the shortest path between two states, the result is cached until
+        a new arc is added into the state graph
+
+        :param source: the name of the source state
+        :type source: str
+        :param target: the name of the target state
+        :type target: str
+        :return: list of arrows
+        :rtype: list[Arrow]
+        """
+        key = (source, target)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = shortest_path(self._state_machine.graph, source, target)
+            self._path_cache[key] = path
+        return path
+
     def _execute_path(self, path: list[Arrow]) -> str:
         if not path:
             return ""
@@ -333,7 +389,12 @@ class Explorer:
                  empty if no immature state is reachable form the source
         :rtype: State
         """
-        for name in self._state_machine.bfs(source):
+        order = self._bfs_cache.get(source)
+        if order is None:
+            order = self._state_machine.bfs(source)
+            self._bfs_cache[source] = order
+
+        for name in order:
             if not self._is_mature_state(name):
                 return name
 
@@ -64,26 +64,30 @@ class FsmExporter:
         event_list: dict[str, dict] = {}
         transition_output: dict[str, dict[str, dict]] = {}
 
-        vs_list = self._state_machine.graph.vs
-        es_list = self._state_machine.graph.es
-        for vertex in vs_list:
-            name = vertex.attributes()["name"]
-            value = vertex.attributes().get("detail", "")
+        # read every attribute in bulk, a missing attribute gets the default
+        graph = self._state_machine.graph
+        state_names = self._state_machine.nodes
+        state_details = _attribute_values(graph.vs, "detail", "")
+        for name, value, out_degree in zip(
+            state_names, state_details, graph.outdegree()
+        ):
             state_list[name] = value
-            if vertex.outdegree() > 0:
+            if out_degree > 0:
                 state_transitions[name] = {}
                 transition_output[name] = {}
 
-        for edge in es_list:
-            name = edge.attributes()["name"]
-            value = edge.attributes().get("detail", "")
-            output = edge.attributes().get("output", {})
+        for (source_id, target_id), name, value, output in zip(
+            graph.get_edgelist(),
+            _attribute_values(graph.es, "name", None),
+            _attribute_values(graph.es, "detail", ""),
+            _attribute_values(graph.es, "output", None),
+        ):
             event_list[name] = value
 
-            source = vs_list[edge.source].attributes()["name"]
-            target = vs_list[edge.target].attributes()["name"]
-            state_transitions[source][name] = target
-            transition_output[source][name] = output
+            source = state_names[source_id]
+            state_transitions[source][name] = state_names[target_id]
+            # a new dict for each missing output, not a shared default
+            transition_output[source][name] = {} if output is None else output
 
         return state_transitions, state_list, event_list, transition_output
 
@@ -162,26 +166,39 @@ class FsmExporter:
 
         fields = ["S_source"] + list(event_names)
         with open(filename, "w", encoding="utf-8", newline="") as csv:
-            writer = DictWriter(csv, fieldnames=fields)
+            # the invalid transitions are filled with the empty restval
+            writer = DictWriter(csv, fieldnames=fields, restval="")
             writer.writeheader()
-            for source, edges in matrix.items():
-                row = {"S_source": source}
-                for event, target in edges.items():  # add defined transitions
-                    row["E_" + event] = target
-                for key in event_names:  # add invalid transitions
-                    if key not in row:
-                        row[key] = ""
-                writer.writerow(row)
+            writer.writerows(
+                {
+                    "S_source": source,
+                    **{"E_" + event: target for event, target in edges.items()},
+                }
+                for source, edges in matrix.items()
+            )
 
     def _write_detail_to_csv(self, filename: str, detail: dict[str, str]) -> None:
         with open(filename, "w", encoding="utf-8", newline="") as csv:
             writer = DictWriter(csv, ["Name", "Detail"])
             writer.writeheader()
+            writer.writerows(
+                {"Name": key, "Detail": value} for key, value in detail.items()
+            )
+
 
-            for key, value in detail.items():
-                writer.writerow(
-                    {
-                        "Name": key,
-                        "Detail": value,
-                    }
-                )
+def _attribute_values(sequence, name: str, default) -> list:
+    """
+    Get the values of an attribute of all the vertices or edges
+
+    :param sequence: the vertex or edge sequence of a graph
+    :type sequence: VertexSeq | EdgeSeq
+    :param name: the name of the attribute
+    :type name: str
+    :param default: the value if the attribute is not defined
+    :type default: Any
+    :return: list of the attribute values in the order of the sequence
+    :rtype: list
+    """
+    if name in sequence.attributes():
+        return sequence[name]
+    return [default] * len(sequence)
@@ -2,9 +2,11 @@
 Import data into a finit state machine
 """
 
+from contextlib import nullcontext
 from csv import DictReader
+from typing import TextIO, Union
 
-from ait.graph_wrapper import GraphWrapper, Arrow
+from ait.graph_wrapper import GraphWrapper
 
 
 class FsmImporter:
@@ -24,10 +26,10 @@ class FsmImporter:
 
     def from_csv(
         self,
-        state_transitions: str,
-        states: str = None,
-        events: str = None,
-        transition_results: str = None,
+        state_transitions: Union[str, TextIO],
+        states: Union[str, TextIO] = None,
+        events: Union[str, TextIO] = None,
+        transition_results: Union[str, TextIO] = None,
     ) -> GraphWrapper:
         """
         Load the state machine from CSV files.
@@ -62,12 +64,16 @@ class FsmImporter:
             :file: ../tests/data/example_output.csv
             :header-rows: 1
 
+        Each file can be given by its name or as an opened text file object.
+
         :param state_transitions: the file name of the transition matrix
-        :type state_transitions: str
+        :type state_transitions: Union[str, TextIO]
         :param states: the file name of the states detail
-        :type states: str, optional
+        :type states: Union[str, TextIO], optional
         :param events: the file name of the events detail
-        :type events: str, optional
+        :type events: Union[str, TextIO], optional
+        :param transition_results: the file name of the transition results
+        :type transition_results: Union[str, TextIO], optional
         :return: the state machine
         :rtype: GraphWrapper
         """
@@ -123,26 +129,49 @@ class FsmImporter:
         :return: the state machine
         :rtype: GraphWrapper
         """
+        state_list = state_list or {}
+        # the states on the transitions in the order of appearance, added to
+        # the graph in one batch
+        states: dict[str, str] = {}
+        for source, transitions in state_transitions.items():
+            for target in transitions.values():
+                if source not in states:
+                    states[source] = state_list.get(source, "")
+                if target not in states:
+                    states[target] = state_list.get(target, "")
+
         fsm = GraphWrapper()
+        if states:
+            fsm.graph.add_vertices(
+                list(states), attributes={"detail": list(states.values())}
+            )
+        # each source/event pair is unique in the matrix, the transitions are
+        # added to the graph in one batch without the uniqueness check
+        event_list = event_list or {}
+        edges: list[tuple[str, str]] = []
+        names: list[str] = []
+        details: list[str] = []
+        outputs: list = []
         for source, transitions in state_transitions.items():
             results = transition_results.get(source, {}) if transition_results else {}
             for event, target in transitions.items():
-                fsm.add_arc(
-                    Arrow(source, target, event),
-                    source_detail=state_list.get(source, "") if state_list else "",
-                    target_detail=state_list.get(target, "") if state_list else "",
-                    event_detail=event_list.get(event, "") if event_list else "",
-                    transition_result=results.get(event, {}),
-                )
+                edges.append((source, target))
+                names.append(event)
+                details.append(event_list.get(event, ""))
+                outputs.append(results.get(event, {}))
+        if edges:
+            fsm.graph.add_edges(
+                edges,
+                attributes={"name": names, "detail": details, "output": outputs},
+            )
         return fsm
 
-    def _populate_state_transition(self, filename: str) -> dict[str, dict[str, str]]:
-        if not isinstance(filename, str):
-            raise ValueError(f"invalid argument filename: {filename}")
-
+    def _populate_state_transition(
+        self, filename: Union[str, TextIO]
+    ) -> dict[str, dict[str, str]]:
         result: dict[str, dict[str, str]] = {}
 
-        with open(filename, "r", encoding="utf-8", newline="") as csv:
+        with _open_csv(filename) as csv:
             reader = DictReader(csv)
             for row in reader:
                 source = row.pop("S_source")
@@ -158,15 +187,12 @@ class FsmImporter:
 
         return result
 
-    def _populate_details(self, filename: str) -> dict[str, str]:
+    def _populate_details(self, filename: Union[str, TextIO]) -> dict[str, str]:
         if not filename:
             return {}
 
-        if not isinstance(filename, str):
-            raise ValueError(f"invalid argument filename: {filename}")
-
         result = {}
-        with open(filename, "r", encoding="utf-8", newline="") as csv:
+        with _open_csv(filename) as csv:
             # the file has 2 columns, name and value
             reader = DictReader(csv)
             for row in reader:
@@ -175,7 +201,9 @@ class FsmImporter:
 
         return result
 
-    def _populate_transition_results(self, filename: str) -> dict[str, dict[str, str]]:
+    def _populate_transition_results(
+        self, filename: Union[str, TextIO]
+    ) -> dict[str, dict[str, str]]:
         """
         The first column of the transition result is the state names.
         The rest of the data is the output when an event happens at source state.
@@ -183,11 +211,8 @@ class FsmImporter:
         if not filename:
             return {}
 
-        if not isinstance(filename, str):
-            raise ValueError(f"invalid argument filename: {filename}")
-
         result: dict[str, dict[str, str]] = {}
-        with open(filename, "r", encoding="utf-8", newline="") as csv:
+        with _open_csv(filename) as csv:
             reader = DictReader(csv)
             for row in reader:
                 source = row.pop("S_source")
@@ -197,3 +222,22 @@ class FsmImporter:
                     result[source][event_name] = output
 
         return result
+
+
+def _open_csv(source: Union[str, TextIO]):
+    """
+    Open a csv file by name, or use an opened text file object as is.
+    The file object is not closed when the context exits, it belongs to the
+    caller.
+
+    :param source: the file name or the file object
+    :type source: Union[str, TextIO]
+    :raises ValueError: if the source is neither a name nor a file object
+    :return: the context manager of the file object
+    :rtype: ContextManager[TextIO]
+    """
+    if isinstance(source, str):
+        return open(source, "r", encoding="utf-8", newline="")
+    if hasattr(source, "read"):
+        return nullcontext(source)
+    raise ValueError(f"invalid argument filename: {source}")
@@ -10,7 +10,7 @@ from igraph import Graph, Vertex, Edge
 from ait.interface import Transition
 
 
-@dataclass
+@dataclass(slots=True)
 class Arrow:
     """
     An arrow is a directed edge in the directed graph with an ordered pair of
@@ -107,7 +107,9 @@ class GraphWrapper:
         :return: list of vertices name
         :rtype: list[str]
         """
-        return [vertex.attributes()["name"] for vertex in self._graph.vs]
+        if not self._graph.vcount():
+            return []
+        return self._graph.vs["name"]
 
     @property
     def arcs(self) -> list[Arrow]:
@@ -117,7 +119,16 @@ class GraphWrapper:
         :return: list of arrows
         :rtype: list[Arrow]
         """
-        return [edge_to_arrow(edge, self._graph) for edge in self._graph.es]
+        if not self._graph.ecount():
+            return []
+        # fetch the names in bulk rather than per edge
+        names = self._graph.vs["name"]
+        return [
+            Arrow(names[source], names[target], name)
+            for (source, target), name in zip(
+                self._graph.get_edgelist(), self._graph.es["name"]
+            )
+        ]
 
     def get_node(self, name: str) -> Vertex:
         """
@@ -254,7 +265,8 @@ class GraphWrapper:
             return []
 
         vids = self._graph.bfs(name)[0]  # vertex ids visited in BFS order
-        return [self._graph.vs[vid].attributes()["name"] for vid in vids]
+        names = self._graph.vs["name"]
+        return [names[vid] for vid in vids]
 
     def update_node_attr(self, data: dict[str, dict[str, any]]):
         """
@@ -264,12 +276,11 @@ class GraphWrapper:
         :type data: dict[str, dict[str, any]]
         """
         vertices = self._graph.vs
-        for vertex in vertices:
-            vertex_name = vertex.attributes()["name"]
+        for vid, vertex_name in enumerate(self.nodes):
             try:
                 attrs = data[vertex_name]
                 for key, value in attrs.items():
-                    vertices[vertex.index][key] = value
+                    vertices[vid][key] = value
             except KeyError:
                 continue
 
@@ -281,12 +292,12 @@ class GraphWrapper:
         :type data: dict[str, dict[str, any]]
         """
         edges = self._graph.es
-        for edge in edges:
-            edge_name = edge.attributes()["name"]
+        edge_names = edges["name"] if self._graph.ecount() else []
+        for eid, edge_name in enumerate(edge_names):
             try:
                 attrs = data[edge_name]
                 for key, value in attrs.items():
-                    edges[edge.index][key] = value
+                    edges[eid][key] = value
             except KeyError:
                 continue
 
@@ -296,10 +307,13 @@ def is_connected(graph: Graph) -> bool:
     Check all the vertices are connected. If the graph is weak connected
     return true, we don't need bidirection connected.
 
+    An empty graph is not connected.
+
     :return: true if the graph is connected
     :rtype: bool
     """
-    return graph.is_connected(mode="weak")
+    # igraph before 0.10 reports the null graph as connected
+    return graph.vcount() > 0 and graph.is_connected(mode="weak")
 
 
 def edge_to_arrow(edge: Edge, graph: Graph) -> Arrow:
@@ -315,7 +329,7 @@ def edge_to_arrow(edge: Edge, graph: Graph) -> Arrow:
     """
     vertices = graph.vs
     return Arrow(
-        vertices[edge.source].attributes()["name"],
-        vertices[edge.target].attributes()["name"],
-        edge.attributes()["name"],
+        vertices[edge.source]["name"],
+        vertices[edge.target]["name"],
+        edge["name"],
     )
@@ -22,6 +22,11 @@ class State(ABC):
     unique collection of properties.
 
     This interface defines properties and methods a State class should provide.
+
+    ``name`` and ``value`` are plain dataclass fields. Subclasses should set
+    them as instance attributes (e.g. via ``super().__init__(name, value)``)
+    rather than overriding them with properties, since they are read on every
+    transition while exploring the state machine.
     """
 
     name: str
@@ -49,25 +54,6 @@ class State(ABC):
         :rtype: bool
         """
 
-    # @property
-    # @abstractmethod
-    # def name(self) -> str:
-    #     """
-    #     The unique state name in the system
-
-    #     :return: the name of the state
-    #     :rtype: str
-    #     """
-
-    # @property
-    # @abstractmethod
-    # def value(self) -> dict:
-    #     """The value of the state
-
-    #     :return: a dictionary represents the state
-    #     :rtype: Dict
-    #     """
-
     @property
     @abstractmethod
     def is_valid(self) -> bool:
@@ -88,6 +74,9 @@ class Event(ABC):
 
     The events are the outside data sent to the SUT. Each event has a unique
     name. The events can be fired to the SUT and get a result back.
+
+    Like :class:`State`, ``name`` and ``value`` are plain dataclass fields and
+    should not be overridden with properties.
     """
 
     name: str
@@ -160,6 +149,39 @@ class SUT(ABC):
     def state(self) -> State:
         """The current state of the system"""
 
+    def fire_batch(
+        self, events: list[Event], origin: State = None
+    ) -> list[tuple[dict, State]]:
+        """
+        Fire a batch of events on the current state in order.
+        The batch stops after the first event that leaves the origin state, the
+        rest of the events are not fired. The default implementation fires the
+        events one by one, override it if the system can process several
+        requests in a single call.
+
+        The explorer records and validates the transitions after the whole
+        batch returns, so the validators see the transitions of a batch only
+        after all of its events are fired.
+
+        :param events: the events to be fired
+        :type events: list[Event]
+        :param origin: the state the events are fired on, defaults to the
+                       current state of the system
+        :type origin: State, optional
+        :return: the output of each fired event and the state after it
+        :rtype: list[tuple[dict, State]]
+        """
+        results = []
+        if origin is None:
+            origin = self.state
+        for event in events:
+            output = event.fire(self)
+            state = self.state
+            results.append((output, state))
+            if state != origin:
+                break
+        return results
+
     @abstractmethod
     def process_request(self, request: dict, **kwargs) -> dict:
         """
@@ -196,6 +218,9 @@ class Validator(ABC):
     ======================
 
     The validator is a collection of rules validating transactions.
+    The explorer fires the pending events of a state in a batch, see
+    :meth:`SUT.fire_batch`, and validates the transitions of the batch once it
+    returns, not between the events.
     """
 
     @abstractmethod
@@ -5,11 +5,11 @@ existing edges to make it Eularian, i.e. allow walking through some edges more
 than once.
 """
 
+from bisect import bisect_left
 from enum import Enum
 import logging
-import random
 
-from igraph import Graph, Edge
+from igraph import Graph
 
 from ait.graph_wrapper import Arrow, GraphWrapper, is_connected
 from ait.utils import shortest_path
@@ -34,27 +34,34 @@ class Eulerian(Enum):
     PATH = 2  # semi-eularian graph
 
 
-def is_eulerian(graph: Graph) -> Eulerian:
+def is_eulerian(graph: Graph, assume_connected: bool = False) -> Eulerian:
     """
     Check the graph is a semi-Eularian, Eularian graph or not
 
+    :param assume_connected: skip the connectivity check if the caller has
+        already checked it, defaults to False
+    :type assume_connected: bool, optional
     :return: type of Eulerian
     :rtype: Eulerian
     """
-    if not is_connected(graph):
+    if not assume_connected and not is_connected(graph):
         return Eulerian.NONE
 
     uneven_degrees = set()
-
-    for vertex in graph.vs:
-        logging.info(
-            "vertex %s, degreee=%d, in_degree=%d, out_degree=%d",
-            vertex.attributes()["name"],
-            vertex.degree(),
-            vertex.degree(mode="in"),
-            vertex.degree(mode="out"),
-        )
-        diff = vertex.degree(mode="out") - vertex.degree(mode="in")
+    in_degrees = graph.indegree()
+    out_degrees = graph.outdegree()
+    verbose = logging.getLogger().isEnabledFor(logging.INFO)
+
+    for vid, (in_degree, out_degree) in enumerate(zip(in_degrees, out_degrees)):
+        if verbose:
+            logging.info(
+                "vertex %s, degreee=%d, in_degree=%d, out_degree=%d",
+                graph.vs[vid]["name"],
+                in_degree + out_degree,
+                in_degree,
+                out_degree,
+            )
+        diff = out_degree - in_degree
         if diff == 0:  # even vertex
             continue
         if diff > 1 or diff < -1:  # degree difference > 1
@@ -82,12 +89,14 @@ def get_uneven_pair(graph) -> tuple[str, str]:
     hub = ""  # in_degree < out_degree
     sink = ""  # in_degree > out_degree
 
-    for vtx in graph.vs:
-        diff = vtx.degree(mode="out") - vtx.degree(mode="in")
+    for vid, (in_degree, out_degree) in enumerate(
+        zip(graph.indegree(), graph.outdegree())
+    ):
+        diff = out_degree - in_degree
         if diff > 0:
-            hub = vtx.attributes()["name"]
+            hub = graph.vs[vid]["name"]
         elif diff < 0:
-            sink = vtx.attributes()["name"]
+            sink = graph.vs[vid]["name"]
 
         if hub and sink:  # stop search when both are found
             break
@@ -95,7 +104,7 @@ def get_uneven_pair(graph) -> tuple[str, str]:
     return hub, sink
 
 
-def duplicate_path(graph: Graph, path: list[Arrow]):
+def duplicate_path(graph: Graph, path: list[Arrow]) -> int:
     """
     Add duplicated path in the graph
 
@@ -103,9 +112,11 @@ def duplicate_path(graph: Graph, path: list[Arrow]):
     :type graph: Graph
     :param path: the list of tuples of source, target and edge
     :type path: list[Arrow]
+    :return: the number of copies of the path added
+    :rtype: int
     """
     if not path:
-        return
+        return 0
 
     try:
         v_from = graph.vs.find(path[0].tail)
@@ -114,12 +125,16 @@ def duplicate_path(graph: Graph, path: list[Arrow]):
             v_from.degree(mode="in") - v_from.degree(mode="out"),
             v_to.degree(mode="out") - v_to.degree(mode="in"),
         )
-        for _ in range(repeat):
-            # copy the path until one of the vertex is balanced
-            for arc in path:
-                graph.add_edge(arc.tail, arc.head, name=arc.name)
+        if repeat > 0:
+            # copy the path until one of the vertex is balanced, in one batch
+            graph.add_edges(
+                [(arc.tail, arc.head) for arc in path] * repeat,
+                attributes={"name": [arc.name for arc in path] * repeat},
+            )
+        return repeat
     except ValueError as exc:
         logging.warning("Error occurred: %s", exc)
+        return 0
 
 
 def eulerize(graph: Graph) -> Eulerian:
@@ -132,41 +147,69 @@ def eulerize(graph: Graph) -> Eulerian:
     :return: the eulrian property of the result
     :rtype: Eulerian
     """
+    # check a graph is eulerizable, adding edges never disconnects the graph
+    # so the connectivity is checked only once
+    if not is_connected(graph):
+        return Eulerian.NONE
+
     # if a graph is already a eulerian graph, no-op
-    eul = is_eulerian(graph)
+    eul = is_eulerian(graph, assume_connected=True)
     if eul != Eulerian.NONE:
         return eul
 
-    # check a graph is eulerizable
-    if not is_connected(graph):
-        return Eulerian.NONE
+    # the imbalance of each vertex is out degree - in degree, only the
+    # vertices on both ends of a duplicated path change
+    names = graph.vs["name"]
+    imbalance = [
+        out_degree - in_degree
+        for in_degree, out_degree in zip(graph.indegree(), graph.outdegree())
+    ]
+    # the uneven vertex ids in ascending order, a balanced vertex is removed
+    hubs = [vid for vid, diff in enumerate(imbalance) if diff > 0]
+    sinks = [vid for vid, diff in enumerate(imbalance) if diff < 0]
 
     # eulerize a graph by repeating edges between uneven vertices
-    while True:
-        # get all the
-        hub, sink = get_uneven_pair(graph)
-        if not hub and not sink:
-            logging.debug("No uneven vertex, the graph is a eulerian graph.")
-            return Eulerian.CIRCUIT
-        if not hub or not sink:
+    while hubs or sinks:
+        if not hubs or not sinks:
             logging.error(
-                "Only has hub vertex %s or sink vertex %s, the graph is invalid.",
-                hub,
-                sink,
+                "Only has hub vertices %s or sink vertices %s, the graph is invalid.",
+                [names[vid] for vid in hubs],
+                [names[vid] for vid in sinks],
             )
             return Eulerian.NONE
 
-        path = shortest_path(graph, sink, hub)
+        # pick the same pair as get_uneven_pair: the first vertex of the kind
+        # found later, and the last vertex of the other kind before it
+        if hubs[0] < sinks[0]:
+            sink_index = 0
+            hub_index = bisect_left(hubs, sinks[0]) - 1
+        else:
+            hub_index = 0
+            sink_index = bisect_left(sinks, hubs[0]) - 1
+        hub = hubs[hub_index]
+        sink = sinks[sink_index]
+        path = shortest_path(graph, names[sink], names[hub])
         if not path:
             # if no path from the sink vertex to the hub vertex, the graph is
             # - either a semi-eularian graph, it has a Euler path, the sink and
             #   hub vertices are the start and end points
             # - or not able to be converted to a Eulerian graph by adding existing
             #   edges.
-            return is_eulerian(graph)
+            return is_eulerian(graph, assume_connected=True)
 
         # add arcs from the sink node to the hub node to make at least one node even
-        duplicate_path(graph, path)
+        repeat = duplicate_path(graph, path)
+        if not repeat:
+            return is_eulerian(graph, assume_connected=True)
+        imbalance[sink] += repeat
+        imbalance[hub] -= repeat
+        if not imbalance[sink]:
+            del sinks[sink_index]
+        if not imbalance[hub]:
+            del hubs[hub_index]
+
+    logging.debug("No uneven vertex, the graph is a eulerian graph.")
+    return Eulerian.CIRCUIT
 
 
 class EdgeCover(Strategy):
@@ -194,53 +237,54 @@ class EdgeCover(Strategy):
         graph = state_machine.graph.copy()
         if not self._self_circle:
             # delete self circle edge
-            def self_circuit(edge: Edge) -> bool:
-                return edge.source == edge.target
-
-            graph.delete_edges(self_circuit)
+            graph.delete_edges(
+                [eid for eid, loop in enumerate(graph.is_loop()) if loop]
+            )
         if is_eulerian(graph) == Eulerian.NONE:
             eulerize(graph)
 
         self._paths.clear()
-        self._dfs(graph, start)
+        self._walk(graph, start)
         self._paths.reverse()
         return self._paths
 
-    def _dfs(self, graph: Graph, current: str, incoming_edge: str = ""):
+    def _walk(self, graph: Graph, start: str):
         """
-        Depth First Search
-        Start from current vertex, choose the first outgoing edge to traverse
-        to the adjacent vertex and delete the edge. Call the dfs method on the
-        new vertex until the vertex has no outgoing edge. Push the edge and
-        the vertex into the stack. Continue the search on the next edge of the
-        predecessor vertex until all no edge left.
+        Iterative Hierholzer walk
+        Start from the start vertex, follow the first unused outgoing edge to
+        the adjacent vertex until reaching a vertex without unused outgoing
+        edge. Then push the vertex and its incoming edge into the paths and
+        backtrack to the predecessor vertex to continue with its next unused
+        edge, until all the edges are used.
 
         :param graph: the graph to traverse
         :type graph: Graph
-        :param current: name of current vertex
-        :type current: str
-        :param incoming_edge: the edge points to this vertex
-        :type incoming_edge: str, optional
+        :param start: name or index of the start vertex
+        :type start: str
         :raises UnknownState: if the vertex does not exist
         """
         try:
-            vertex = graph.vs.find(current)
-            # logging.debug("Visit vertex %s", current)
-            while True:
-                out_edges = vertex.out_edges()
-                if not out_edges:
-                    # push the vertex and the incoming edge into the stack when
-                    # there is no outgoing edge
-                    self._paths.append((current, incoming_edge))
-                    break
-
-                # edge = out_edges[0]
-                edge = random.choice(out_edges)
-                # move to the adjacent vertex and delete the edge
-                adjacent = graph.vs[edge.target].attributes()["name"]
-                edge_name = edge.attributes()["name"]
-                graph.delete_edges(edge.index)
-                self._dfs(graph, adjacent, edge_name)
+            start_vid = graph.vs.find(start).index
         except ValueError as exc:
             logging.error("Error %s", exc)
             raise UnknownState from exc
+
+        # outgoing edges of each vertex as (target vertex id, edge name)
+        names = graph.vs["name"]
+        out_edges: list[list[tuple[int, str]]] = [[] for _ in range(len(names))]
+        for edge in graph.es:
+            out_edges[edge.source].append((edge.target, edge["name"]))
+        next_edge = [0] * len(names)  # index of the next unused outgoing edge
+
+        stack = [(start_vid, "")]  # vertex id and its incoming edge name
+        while stack:
+            vid, incoming_edge = stack[-1]
+            if next_edge[vid] < len(out_edges[vid]):
+                # move to the adjacent vertex through the next unused edge
+                stack.append(out_edges[vid][next_edge[vid]])
+                next_edge[vid] += 1
+            else:
+                # no unused outgoing edge, push the vertex and the incoming
+                # edge into the paths and backtrack
+                self._paths.append((names[vid], incoming_edge))
+                stack.pop()
@@ -4,7 +4,6 @@ Covers all the nodes (states)
 """
 
 import logging
-from copy import deepcopy
 from typing import Union
 from igraph import Graph
 from ait.errors import UnknownState
@@ -12,39 +11,6 @@ from ait.graph_wrapper import GraphWrapper, Arrow
 from ait.strategy.strategy import Strategy
 
 
-def _max_subset(
-    universal_set: set[int], subsets: list[list[int]]
-) -> tuple[int, set[int]]:
-    """
-    Get the max subset for candidates
-
-    :param universal_set: the whole set
-    :type universal_set: set[int]
-    :param subsets: list of subsets
-    :type subsets: list[list[int]]
-    :return: index of the subset and the complement set
-    :rtype: tuple[int, set[int]]
-    """
-    if not universal_set:
-        logging.warning("No unvisited vertex")
-        return -1, universal_set
-
-    if not subsets:
-        logging.warning("No candidate path")
-        return -1, universal_set
-
-    index = 0
-    missing = universal_set - set(subsets[0])
-    for i in range(1, len(subsets)):
-        diff = universal_set - set(subsets[i])
-        if not diff:
-            return i, diff
-        if len(missing) > len(diff):
-            index = i
-            missing = diff
-    return index, missing
-
-
 class CandidatePath:
     """
     A data struct stores a path of a vertex
@@ -98,12 +64,18 @@ class NodeCover(Strategy):
     def __init__(self):
         super().__init__()
         self._graph: Graph = None
+        self._names: list[str] = []  # the vertices name indexed by vertex id
+        # names of the edges between each pair of source and target vertex ids
+        self._edge_names: dict[tuple[int, int], list[str]] = {}
         self._unvisited_vids: set[int] = set()
         self._current_vid = -1  # the last visited vertex id
         # cacheed simple paths for all the vertices
         # key is the vertex id, value is the list of vertex sequence represent
         # list of vertices on the simple path
         self._simple_paths_cache: dict[int, list[list[int]]] = {}
+        # the cached simple paths still covering unvisited vertices, narrowed
+        # down by each election, the original cache is never modified
+        self._active_paths: dict[int, list[list[int]]] = {}
 
     def travel(self, state_machine: GraphWrapper, start: Union[str, int]):
         """
@@ -114,8 +86,20 @@ class NodeCover(Strategy):
         :param start: the start state
         :type start: Union[str, int]
         """
-        self._graph = deepcopy(state_machine.graph)
+        # the graph is only read, no need to copy it
+        self._graph = state_machine.graph
+        self._names = self._graph.vs["name"]
+        self._edge_names = {}
+        for edge in self._graph.es:
+            self._edge_names.setdefault((edge.source, edge.target), []).append(
+                edge["name"]
+            )
         self._unvisited_vids = set(range(len(self._graph.vs)))
+        self._simple_paths_cache = {}
+        self._active_paths = {}
+        # start over, the tracks of a previous travel are not kept
+        self._paths.clear()
+        self._current_vid = -1
         if isinstance(start, str):
             vertex = self._graph.vs.find(start)
             if not vertex:
@@ -145,27 +129,36 @@ class NodeCover(Strategy):
 
     def _get_simple_paths(self, vid: int) -> list[list[int]]:
         """
-        Get all the simple paths starting from a vertex to all the unvisited vertices.
-        The simple path is a path without circuit.
+        Get the simple paths starting from a vertex to all the unvisited vertices.
+        The simple path is a path without circuit. Only the shortest path to
+        each unvisited vertex is taken, enumerating all the simple paths grows
+        exponentially with the size of the graph.
 
         :param vid: the index of the start vertex
         :type vid: int
-        :return: all the simple paths represent in list of sequence of vertice,
+        :return: the simple paths represent in list of sequence of vertice,
                  sorted in length of path
         :rtype: list[list[int]]
         """
         if vid in self._simple_paths_cache:
             return self._simple_paths_cache[vid]
 
-        paths = sorted(
-            self._graph.get_all_simple_paths(vid, to=self._unvisited_vids), key=len
+        # igraph warns about the unreachable targets, only ask for the
+        # vertices reachable from the start vertex
+        reachable = set(self._graph.subcomponent(vid, mode="out"))
+        targets = [target for target in self._unvisited_vids if target in reachable]
+        shortest_paths = self._graph.get_shortest_paths(
+            vid, to=targets, mode="out", output="vpath"
         )
+        # skip the unreachable vertices and the start vertex itself
+        paths = sorted((path for path in shortest_paths if len(path) > 1), key=len)
         logging.info(
             "get %d simple paths from %d to %s", len(paths), vid, self._unvisited_vids
         )
         if not paths:
             logging.debug("can't go to anywhere from the vertex %s", vid)
         self._simple_paths_cache[vid] = paths
+        self._active_paths[vid] = paths
         return paths
 
     def _update_path(self, path: list[int]):
@@ -180,7 +173,7 @@ class NodeCover(Strategy):
             return
 
         logging.info("add new path: %s", path)
-        self._unvisited_vids -= set(path)
+        self._unvisited_vids.difference_update(path)
         if self._current_vid != path[0]:
             # if there is no existing path, or the last vertex of the current
             # path is different than the new path's first vertex, create a new
@@ -188,22 +181,18 @@ class NodeCover(Strategy):
             self._paths.append([])
         for source, target in zip(path[:-1], path[1:]):
             # go through each step
-            edges = self._graph.es.select(_from=source, _to=target)
+            edges = self._edge_names.get((source, target))
             if not edges:
                 logging.error("No edge from %s to %s", source, target)
                 return
             self._paths[-1].append(
-                Arrow(
-                    self._graph.vs[source].attributes()["name"],
-                    self._graph.vs[target].attributes()["name"],
-                    edges[0].attributes()["name"],
-                )
+                Arrow(self._names[source], self._names[target], edges[0])
             )
 
             if len(edges) > 1:
-                # more than 1 connection between the nodes, delete the used
+                # more than 1 connection between the nodes, drop the used
                 # one to avoid duplicate path
-                self._graph.delete_edges(edges[0].index)
+                edges.pop(0)
 
         # set the last visited vertex id to the end of the path
         self._current_vid = path[-1]
@@ -265,30 +254,39 @@ class NodeCover(Strategy):
             logging.warning("No unvisited vertex")
             return CandidatePath()
 
-        if not self._simple_paths_cache[vid]:
+        paths = self._active_paths[vid]
+        if not paths:
             return CandidatePath()
 
-        # filter out the paths do have any unvisited vertex
-        filtered_paths: list[list[int]] = []
-        for path in self._simple_paths_cache[vid]:
-            if self._unvisited_vids.intersection(set(path)):
-                filtered_paths.append(path)
-        self._simple_paths_cache[vid] = filtered_paths
-
-        # find the shortest path covers most unvisited vertices
+        # find the shortest path covers most unvisited vertices, and filter out
+        # the paths do not have any unvisited vertex at the same time.
+        # a path can't cover more vertices than its length, so scan from the
+        # longest path and stop once the paths are shorter than the coverage
+        filtered_paths: list[list[int]] = []  # in descending order of length
         coverage = -1
         temp_path = []
-        for path in filtered_paths:
-            covered = len(self._unvisited_vids.intersection(set(path)))
-            if coverage < covered:
+        for index in range(len(paths) - 1, -1, -1):
+            path = paths[index]
+            if len(path) < coverage:
+                # keep the rest paths, they are filtered in the next election
+                filtered_paths.extend(reversed(paths[: index + 1]))
+                break
+            covered = len(self._unvisited_vids.intersection(path))
+            if not covered:
+                continue
+            filtered_paths.append(path)
+            if coverage <= covered:
+                # prefer the shorter path if the coverage is the same
                 coverage = covered
                 temp_path = path
-                logging.info(
-                    "%d unvisited nodes %s are covered by new path %s",
-                    coverage,
-                    self._unvisited_vids,
-                    temp_path,
-                )
-            if covered == total:
-                break
+        if temp_path:
+            # log the winner only, not every better candidate in the scan
+            logging.info(
+                "%d unvisited nodes %s are covered by new path %s",
+                coverage,
+                self._unvisited_vids,
+                temp_path,
+            )
+        filtered_paths.reverse()
+        self._active_paths[vid] = filtered_paths
         return CandidatePath(coverage, temp_path)
@@ -25,34 +25,29 @@ def shortest_path(graph: Graph, source: str, target: str) -> list[Arrow]:
         logging.warning("No path from %s to %s", source, target)
         return []
 
-    result = []
-    for eid in path:
-        edge = graph.es[eid]
-        result.append(
-            Arrow(
-                graph.vs[edge.source].attributes()["name"],
-                graph.vs[edge.target].attributes()["name"],
-                edge.attributes()["name"],
-            )
-        )
-
-    return result
+    # fetch the names in bulk, the path is contiguous so the head of an arrow
+    # is the tail of the next one
+    edges = graph.es[path]
+    vids = [edge.source for edge in edges]
+    vids.append(edges[-1].target)
+    names = graph.vs[vids]["name"]
+    return [
+        Arrow(tail, head, name)
+        for tail, head, name in zip(names, names[1:], edges["name"])
+    ]
 
 
 def dump_path(path: list[Arrow]) -> str:
     """
-    Convert a list of arrows to human readable string
+    Convert a list of arrows to human readable string, one arrow per line
 
     :param path: the path
     :type path: list[Arrow]
-    :return: string like A--1->B--2->C...
+    :return: string like "A--1->B\nB--2->C\n", empty if the path is empty
     :rtype: str
     """
     if not path:
         return ""
 
-    result = ""
-    for arrow in path:
-        result += arrow.tail + "--" + arrow.name + "->" + arrow.head + "\n"
-
-    return str(path)
+    # one line per arrow, joined once instead of growing a string
+    return "".join(f"{arrow}\n" for arrow in path)
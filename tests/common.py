@@ -4,6 +4,7 @@ This module defines the target system for testing
 - TestState
 - TestEvent
 - TestApp
+- ChainTest
 
 """
 
@@ -62,6 +63,8 @@ class EventTest(Event):
 
     def __init__(self, event_name: str):
         super().__init__(event_name, {"name": event_name})
+        # the request does not depend on the arguments, build it once
+        self._request = {"name": event_name}
 
     def __str__(self) -> str:
         return f"name={self.name}, value={self.value}"
@@ -78,7 +81,7 @@ class EventTest(Event):
         :return: the request
         :rtype: dict
         """
-        return {"name": self.name}
+        return self._request
 
     def fire(self, sut: SUT) -> dict:
         """Fire the event on source state with arguments
@@ -148,6 +151,7 @@ class AppTest(SUT):
         name: StateTest(name, {"state": name})
         for name in ["Idle", "Running", "Paused", "Stopped"]
     }
+    _INITIAL_STATE = state_list["Idle"]
 
     transition_table = {
         "Idle": {"Initialize": "Running", "Reset": "Idle"},
@@ -161,7 +165,7 @@ class AppTest(SUT):
         Initialize the SUT
         """
         super().__init__({})
-        self._current_state = AppTest.state_list["Idle"]
+        self._current_state = AppTest._INITIAL_STATE
 
     def start(self) -> State:
         """
@@ -170,12 +174,12 @@ class AppTest(SUT):
         :return: the initial state
         :rtype: State
         """
-        self._current_state = AppTest.state_list["Idle"]
+        self._current_state = AppTest._INITIAL_STATE
         return self._current_state
 
     def reset(self):
         """reset the system to the initial state"""
-        self._current_state = AppTest.state_list["Idle"]
+        self._current_state = AppTest._INITIAL_STATE
 
     @property
     def state(self) -> State:
@@ -196,12 +200,70 @@ class AppTest(SUT):
         :return: result of the request processing
         :rtype: dict
         """
-        try:
-            target = AppTest.transition_table[self._current_state.name][request["name"]]
-            self._current_state = AppTest.state_list[target]
-            return {"success": 0}
-        except KeyError:
+        # invalid requests are common while exploring, look up without raising
+        transitions = AppTest.transition_table.get(self._current_state.name, {})
+        target = transitions.get(request.get("name"))
+        if target is None:
             logging.info(
                 "Invalid request: %s, current state: %s", request, self._current_state
             )
             return {"error": -1}
+        self._current_state = AppTest.state_list[target]
+        return {"success": 0}
+
+
+class ChainTest(SUT):
+    """
+    The simulated application with a long chain of states. The event ``a``
+    moves to the next state and stays on the last one, the event ``b`` never
+    changes the state.
+
+    .. code-block:: none
+
+        S0 --a-> S1 --a-> ... --a-> S<length-1>
+    """
+
+    def __init__(self, length: int):
+        """
+        Initialize the SUT
+
+        :param length: number of the states in the chain
+        :type length: int
+        """
+        super().__init__({})
+        self.state_list = [
+            StateTest(f"S{index}", {"state": index}) for index in range(length)
+        ]
+        self._index = 0
+
+    def start(self) -> State:
+        """
+        Initialize the system.
+
+        :return: the initial state
+        :rtype: State
+        """
+        self._index = 0
+        return self.state
+
+    def reset(self):
+        """reset the system to the initial state"""
+        self._index = 0
+
+    @property
+    def state(self) -> State:
+        """The current state of the system"""
+        return self.state_list[self._index]
+
+    def process_request(self, request: dict, **kwargs) -> dict:
+        """
+        Process an request
+
+        :param request: the request received
+        :type dict: dict
+        :return: result of the request processing
+        :rtype: dict
+        """
+        if request.get("name") == "a":
+            self._index = min(self._index + 1, len(self.state_list) - 1)
+        return {"success": 0}
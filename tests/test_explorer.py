@@ -1,11 +1,14 @@
 """Test state transitions"""
 
 import logging
+from pathlib import Path
+
 import pytest
 
 from ait.explorer import Explorer
 from ait.fsm_exporter import FsmExporter
-from tests.common import EventTest, AppTest
+from ait.graph_wrapper import Arrow
+from tests.common import EventTest, AppTest, ChainTest
 from ait.strategy.edge_cover import EdgeCover
 from ait.strategy.node_cover import NodeCover
 
@@ -25,6 +28,7 @@ EVENT_LIST = {
         ("Paused", "Stop", "Stopped"),
         ("Stopped", "Reset", "Start"),
     ],
+    ids="-".join,
 )
 def test_transition(transition):
     """test state transitions"""
@@ -34,7 +38,7 @@ def test_transition(transition):
     test_app.state = AppTest.state_list[source_name]
     expected_target_name = transition[2]
     event_name = transition[1]
-    event = EventTest(event_name)
+    event = EVENT_LIST[event_name]
 
     # WHEN
     output = event.fire(test_app)
@@ -60,7 +64,7 @@ def test_invalide_transition():
                 assert test_app.state == source
 
 
-def test_engine():
+def test_engine(tmp_path: Path):
     """test state engine"""
     # GIVEN
     test_app = AppTest()
@@ -71,11 +75,11 @@ def test_engine():
     logging.info("matrix=%s", explorer.maze)
     exporter = FsmExporter(state_graph)
     exporter.to_svg(
-        "logs/test_engine.svg",
+        str(tmp_path / "test_engine.svg"),
         show_self_circle=False,
         margin=100,
     )
-    exporter.to_csv("logs/test_engine.csv", True)
+    exporter.to_csv(str(tmp_path / "test_engine.csv"), True)
 
     state_traveller = NodeCover()
     state_traveller.travel(explorer.state_machine, "Idle")
@@ -90,3 +94,103 @@ def test_engine():
         "Paths start from initial state via all transitions at least once: \n%s",
         transition_traveller.tracks,
     )
+
+
+def test_explore_all_transitions():
+    """test the explorer exercises every event on every reachable state"""
+    # GIVEN
+    test_app = AppTest()
+    init_state = test_app.start()
+    explorer = Explorer(test_app, EVENT_LIST)
+
+    # WHEN
+    explorer.explore(init_state)
+
+    # THEN
+    state_graph = explorer.state_machine
+    assert sorted(state_graph.nodes) == sorted(AppTest.state_list)
+    assert len(state_graph.arcs) == len(AppTest.state_list) * len(EVENT_LIST)
+    for source, transitions in AppTest.transition_table.items():
+        for event, target in transitions.items():
+            assert state_graph.get_arcs(Arrow(source, target, event))
+
+
+def test_explore_long_chain():
+    """test the explorer does not give up on a chain longer than events**3"""
+    # GIVEN a chain of 20 states and 2 events, 20 > 2**3
+    test_app = ChainTest(20)
+    init_state = test_app.start()
+    events = {name: EventTest(name) for name in ["a", "b"]}
+    explorer = Explorer(test_app, events)
+
+    # WHEN
+    explorer.explore(init_state)
+
+    # THEN every event is exercised on every state of the chain
+    state_graph = explorer.state_machine
+    assert len(state_graph.nodes) == 20
+    assert len(state_graph.arcs) == 20 * 2
+    assert not explorer._get_immature_states()  # pylint: disable=protected-access
+
+
+class _StateName(str):
+    """
+    A case insensitive str subclass as a state name, sys.intern rejects it and
+    it does not hash like the plain str of the same value
+    """
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, str) and self.casefold() == other.casefold()
+
+    def __hash__(self) -> int:
+        return hash(self.casefold())
+
+
+def test_explore_keeps_state_names():
+    """test the explorer does not modify the states of the system"""
+    # GIVEN the states are named by a str subclass
+    test_app = ChainTest(3)
+    for state in test_app.state_list:
+        state.name = _StateName(state.name)
+    init_state = test_app.start()
+    explorer = Explorer(test_app, {name: EventTest(name) for name in ["a", "b"]})
+
+    # WHEN
+    explorer.explore(init_state)
+
+    # THEN
+    assert len(explorer.state_machine.nodes) == 3
+    assert all(isinstance(state.name, _StateName) for state in test_app.state_list)
+
+
+def test_fire_batch():
+    """test a batch of events stops at the first state change"""
+    # GIVEN
+    test_app = AppTest()
+    events = [EVENT_LIST[name] for name in ["Pause", "Initialize", "Stop"]]
+
+    # WHEN
+    results = test_app.fire_batch(events)
+
+    # THEN Pause is rejected on Idle, Initialize moves to Running, Stop is not fired
+    assert len(results) == 2
+    assert "error" in results[0][0]
+    assert results[0][1] == AppTest.state_list["Idle"]
+    assert "success" in results[1][0]
+    assert results[1][1] == AppTest.state_list["Running"]
+    assert test_app.state == AppTest.state_list["Running"]
+
+
+def test_fire_batch_origin():
+    """test a batch of events stops at the first state differs from the origin"""
+    # GIVEN the system is on Idle but the caller expects Running
+    test_app = AppTest()
+    events = [EVENT_LIST[name] for name in ["Reset", "Initialize"]]
+
+    # WHEN
+    results = test_app.fire_batch(events, AppTest.state_list["Running"])
+
+    # THEN the batch stops after Reset, Initialize is not fired
+    assert len(results) == 1
+    assert results[0][1] == AppTest.state_list["Idle"]
+    assert test_app.state == AppTest.state_list["Idle"]
@@ -2,7 +2,6 @@ import pytest
 from ait.fsm_importer import FsmImporter
 from ait.fsm_exporter import FsmExporter
 from ait.graph_wrapper import GraphWrapper
-from unittest.mock import mock_open, patch
 import io
 
 
@@ -51,45 +50,36 @@ def test_import_export_csv_cycle():
         "S_source,E_1,E_2\nS1,Result1,Result2\nS2,Result3,Result4\nS3,,Result5\n"
     )
 
-    # Mock the file reading
-    with patch("builtins.open") as mock_open:
-        mock_open.side_effect = [
-            io.StringIO(state_transitions_csv),
-            io.StringIO(states_csv),
-            io.StringIO(events_csv),
-            io.StringIO(transition_results_csv),
-        ]
-
-        # Create an instance of FsmImporter
-        importer = FsmImporter()
-
-        # Import the data
-        imported_graph = importer.from_csv(
-            "state_transitions.csv",
-            "states.csv",
-            "events.csv",
-            "transition_results.csv",
-        )
-
-        # Create an instance of FsmExporter with the imported graph
-        exporter = FsmExporter(imported_graph)
-
-        # Export the data
-        exported_data = exporter.to_dict()
-
-        # Verify the exported data matches the original input
-        assert exported_data[0] == {
-            "S1": {"1": "S2", "2": "S3"},
-            "S2": {"1": "S1", "2": "S3"},
-            "S3": {"2": "S1"},
-        }
-        assert exported_data[1] == {"S1": "State 1", "S2": "State 2", "S3": "State 3"}
-        assert exported_data[2] == {"1": "Event 1", "2": "Event 2"}
-        assert exported_data[3] == {
-            "S1": {"1": "Result1", "2": "Result2"},
-            "S2": {"1": "Result3", "2": "Result4"},
-            "S3": {"2": "Result5"},
-        }
+    # Create an instance of FsmImporter
+    importer = FsmImporter()
+
+    # Import the data from the file objects, no file is opened
+    imported_graph = importer.from_csv(
+        io.StringIO(state_transitions_csv),
+        io.StringIO(states_csv),
+        io.StringIO(events_csv),
+        io.StringIO(transition_results_csv),
+    )
+
+    # Create an instance of FsmExporter with the imported graph
+    exporter = FsmExporter(imported_graph)
+
+    # Export the data
+    exported_data = exporter.to_dict()
+
+    # Verify the exported data matches the original input
+    assert exported_data[0] == {
+        "S1": {"1": "S2", "2": "S3"},
+        "S2": {"1": "S1", "2": "S3"},
+        "S3": {"2": "S1"},
+    }
+    assert exported_data[1] == {"S1": "State 1", "S2": "State 2", "S3": "State 3"}
+    assert exported_data[2] == {"1": "Event 1", "2": "Event 2"}
+    assert exported_data[3] == {
+        "S1": {"1": "Result1", "2": "Result2"},
+        "S2": {"1": "Result3", "2": "Result4"},
+        "S3": {"2": "Result5"},
+    }
 
 
 def test_importer_exporter_with_empty_data():
@@ -2,6 +2,8 @@
 This moudle test FiniteStateMachine
 """
 
+from pathlib import Path
+
 from ait.graph_wrapper import GraphWrapper, Arrow
 from ait.fsm_importer import FsmImporter
 from ait.fsm_exporter import FsmExporter
@@ -10,14 +12,16 @@ from tests.common import SAMPLES
 
 def verify_graph(state_graph: GraphWrapper, nodes: list[str], arrows: list[Arrow]):
     """verify a graph wrapper is as expected"""
-    assert len(state_graph.nodes) == len(nodes)
-    assert len(state_graph.arcs) == len(arrows)
-
-    for name in nodes:
-        assert state_graph.get_node(name)
+    actual_nodes = state_graph.nodes
+    actual_arcs = state_graph.arcs
+    assert len(actual_nodes) == len(nodes)
+    assert len(actual_arcs) == len(arrows)
 
-    for arc in arrows:
-        assert state_graph.get_arcs(arc)
+    # compare in bulk instead of searching the graph for each item
+    assert set(actual_nodes) == set(nodes)
+    assert {(arc.tail, arc.head, arc.name) for arc in actual_arcs} == {
+        (arc.tail, arc.head, arc.name) for arc in arrows
+    }
 
 
 def test_add_nodes():
@@ -84,20 +88,21 @@ def test_load_from_dict():
     assert SAMPLES["output"] == output
 
 
-def test_export_to_csv():
+def test_export_to_csv(tmp_path: Path):
     """test export data from graph wrpper to a csv file"""
     # GIVEN
     state_graph = FsmImporter().from_dicts(
         SAMPLES["transitions"], SAMPLES["states"], SAMPLES["events"], SAMPLES["output"]
     )
-    FsmExporter(state_graph).to_csv("logs/test_export_state_graph.csv", detail=True)
+    prefix = tmp_path / "test_export_state_graph"
+    FsmExporter(state_graph).to_csv(f"{prefix}.csv", detail=True)
 
     # WHEN
     sg2 = FsmImporter().from_csv(
-        "logs/test_export_state_graph.csv",
-        "logs/test_export_state_graph_states.csv",
-        "logs/test_export_state_graph_events.csv",
-        "logs/test_export_state_graph_output.csv",
+        f"{prefix}.csv",
+        f"{prefix}_states.csv",
+        f"{prefix}_events.csv",
+        f"{prefix}_output.csv",
     )
     transitions, states, events, output = FsmExporter(sg2).to_dict()
 
@@ -1,6 +1,13 @@
 """This module tests Hierholzer's algorithm"""
 
 import logging
+import os
+import random
+from collections import Counter
+from itertools import pairwise
+from pathlib import Path
+
+import pytest
 from igraph import Graph
 from ait.graph_wrapper import Arrow
 
@@ -12,36 +19,46 @@ from ait.strategy.edge_cover import eulerize
 from ait.fsm_importer import FsmImporter
 
 
-def _dump_graph(graph: GraphWrapper, filename: str):
+@pytest.fixture(scope="module")
+def arbiter() -> GraphWrapper:
+    """
+    The state machine generated from arbiter, loaded once for the module.
+    Neither the strategies nor _dump_graph modify the graph, EdgeCover travels
+    on a copy and _dump_graph labels a copy.
+    """
+    return FsmImporter().from_csv("tests/data/arbiter.csv")
+
+
+def _dump_graph(graph: GraphWrapper, prefix: Path):
     """
-    Export data in a directed graph to a csv matrix and a svg file
+    Export data in a directed graph to a csv matrix and a svg file.
+    The files are only for debugging, they are written only if the environment
+    variable AIT_DUMP_GRAPHS is set. The labels are added to a copy of the
+    graph, the graph itself is not modified.
 
     :param graph: the state graph
     :type graph: GraphWrapper
-    :param filename: the filename to be used in csv and svg files
-    :type filename: str
+    :param prefix: the path of the csv and svg files without the suffix
+    :type prefix: Path
     """
-    FsmExporter(graph).to_csv(f"logs/{filename}.csv")
-
-    # add label to vertices and edges
-    v_labels = {}
-    for vertex in graph.graph.vs:
-        name = vertex.attributes()["name"]
-        v_labels[name] = {"label": name}
-    graph.update_node_attr(v_labels)
-
-    e_labels = {}
-    for edge in graph.graph.es:
-        name = edge.attributes()["name"]
-        e_labels[name] = {"label": name}
-    graph.update_edge_attr(e_labels)
+    if not os.environ.get("AIT_DUMP_GRAPHS"):
+        return
+
+    FsmExporter(graph).to_csv(f"{prefix}.csv")
+
+    # label the vertices and edges with their names, one column copy each
+    labelled = GraphWrapper()
+    labelled.graph = graph.graph.copy()
+    labelled.graph.vs["label"] = graph.nodes
+    if labelled.graph.ecount():
+        labelled.graph.es["label"] = labelled.graph.es["name"]
     try:
-        FsmExporter(graph).to_svg(f"logs/{filename}.svg", (0, 0, 500, 500))
+        FsmExporter(labelled).to_svg(f"{prefix}.svg", (0, 0, 500, 500))
     except AttributeError as exc:
         logging.warning("Export graph to svg is not supported because: %s", exc)
 
 
-def test_edge_coverage():
+def test_edge_coverage(tmp_path: Path, request: pytest.FixtureRequest):
     """Test  EdgeCover strategy"""
     # GIVEN
     input_data = {
@@ -54,7 +71,7 @@ def test_edge_coverage():
 
     importer = FsmImporter()
     state_machine = importer.from_dicts(input_data)
-    _dump_graph(state_machine, "test_traveller")
+    _dump_graph(state_machine, tmp_path / request.node.name)
 
     stg = EdgeCover()
 
@@ -66,17 +83,17 @@ def test_edge_coverage():
     eulerize(state_machine.graph)  # make the graph Eulerian to compare the result
     expect_result = state_machine.arcs.copy()
 
-    actual_result = []
-    source = track[-1][0]
-    for path in track[-2::-1]:
-        actual_result.append(Arrow(source, path[0], path[1]))
-        source = path[0]
+    # the track is in walking order, each step is a vertex and the edge that
+    # leads to it from the previous step
+    assert track[0] == ("A", "")  # the walk starts from A without an edge
+    actual_result = [Arrow(prev[0], cur[0], cur[1]) for prev, cur in pairwise(track)]
 
     assert len(expect_result) == len(actual_result)
-    expect_result.sort()
-    actual_result.sort()
-    for elem in list(zip(expect_result, actual_result)):
-        assert elem[0] == elem[1]
+    assert track[-1][0] == "A"  # the eulerized graph has a circuit back to A
+    # compare as multisets, an arrow may be repeated to make the graph eulerian
+    assert Counter((arc.tail, arc.head, arc.name) for arc in expect_result) == Counter(
+        (arc.tail, arc.head, arc.name) for arc in actual_result
+    )
 
 
 def get_least_in_degree_vertex(graph: Graph) -> int:
@@ -88,26 +105,43 @@ def get_least_in_degree_vertex(graph: Graph) -> int:
     :return: vertex index
     :rtype: int
     """
-    degree = graph.vs[0].degree(mode="in")
-    lowest = 0
-    for i in range(1, len(graph.vs)):
-        tmp = graph.vs[i].degree(mode="in")
-        if tmp == 0:
-            return i
-        if tmp < degree:
-            degree = tmp
-            lowest = i
-    return lowest
-
-
-def test_node_coverage():
+    in_degrees = graph.indegree()  # all the in-degrees in one call
+    return in_degrees.index(min(in_degrees))
+
+
+def _random_connected_graph(vcount: int, ecount: int) -> Graph:
+    """
+    Create a random weakly connected directed graph without loops or multiple
+    edges. A random spanning tree is built first and the rest of the edges are
+    picked at random, so no generated graph has to be rejected.
+
+    :param vcount: number of vertices
+    :type vcount: int
+    :param ecount: number of edges, at least vcount - 1
+    :type ecount: int
+    :return: the graph
+    :rtype: Graph
+    """
+    edges = set()
+    for vid in range(1, vcount):
+        # link each vertex to a former one in a random direction
+        edge = (random.randrange(vid), vid)
+        edges.add(edge if random.random() < 0.5 else edge[::-1])
+    candidates = [
+        (source, target)
+        for source in range(vcount)
+        for target in range(vcount)
+        if source != target and (source, target) not in edges
+    ]
+    edges.update(random.sample(candidates, ecount - len(edges)))
+    return Graph(n=vcount, edges=sorted(edges), directed=True)
+
+
+def test_node_coverage(tmp_path: Path, request: pytest.FixtureRequest):
     """Test  NodeCover strategy"""
     # GIVEN
     state_machine = GraphWrapper()
-    while True:
-        state_machine.graph = Graph.Erdos_Renyi(10, m=16, directed=True)
-        if state_machine.graph.is_connected(mode="weak"):
-            break
+    state_machine.graph = _random_connected_graph(10, 16)
     state_machine.graph.vs["name"] = [
         "S_" + str(i) for i in range(len(state_machine.graph.vs))
     ]
@@ -117,7 +151,7 @@ def test_node_coverage():
     state_machine.graph.es["name"] = [
         "E_" + str(i) for i in range(len(state_machine.graph.es))
     ]
-    _dump_graph(state_machine, "test_traveller")
+    _dump_graph(state_machine, tmp_path / request.node.name)
 
     stg = NodeCover()
 
@@ -126,20 +160,20 @@ def test_node_coverage():
     logging.info("all paths: \n%s", stg.tracks)
 
 
-def test_node_coverage_multi_root():
+def test_node_coverage_multi_root(tmp_path: Path, request: pytest.FixtureRequest):
     """
     Test node coverage with multipl root vertices
     """
     # GIVEN
     creator = FsmImporter()
     state_machine = creator.from_csv("tests/data/multi_root.csv")
-    _dump_graph(state_machine, "multi_root")
+    _dump_graph(state_machine, tmp_path / request.node.name)
 
     # get all the root vertices
     roots = set(
-        vertex.index
-        for vertex in state_machine.graph.vs
-        if vertex.degree(mode="in") == 0
+        vid
+        for vid, in_degree in enumerate(state_machine.graph.indegree())
+        if in_degree == 0
     )
     traveller = NodeCover()
 
@@ -153,27 +187,36 @@ def test_node_coverage_multi_root():
     assert not traveller.unvisited_nodes - roots
 
 
-def test_node_coverage_real_data():
+def test_node_coverage_real_data(
+    arbiter: GraphWrapper, tmp_path: Path, request: pytest.FixtureRequest
+):
     """
     Test the node coverage with the matrix generated from arbiter
     """
     # GIVEN
-    state_machine = FsmImporter().from_csv("tests/data/arbiter.csv")
-    _dump_graph(state_machine, "arbiter")
+    state_machine = arbiter
+    _dump_graph(state_machine, tmp_path / request.node.name)
     traveller = NodeCover()
 
     # WHEN
     traveller.travel(state_machine, 0)
     logging.info("all paths: \n%s", traveller.tracks)
+    tracks = traveller.tracks
+
+    # THEN travel again does not accumulate the tracks of the previous travel
+    traveller.travel(state_machine, 0)
+    assert traveller.tracks == tracks
 
 
-def test_edge_coverage_real_data():
+def test_edge_coverage_real_data(
+    arbiter: GraphWrapper, tmp_path: Path, request: pytest.FixtureRequest
+):
     """
     Test the edge coverage with the matrix generated from arbiter
     """
     # GIVEN
-    state_machine = FsmImporter().from_csv("tests/data/arbiter.csv")
-    _dump_graph(state_machine, "arbiter")
+    state_machine = arbiter
+    _dump_graph(state_machine, tmp_path / request.node.name)
     traveller = EdgeCover()
 
     # WHEN
@@ -5,6 +5,7 @@ from ait.strategy.edge_cover import Eulerian, eulerize, is_eulerian
 from ait.graph_wrapper import is_connected
 from ait.graph_wrapper import Arrow
 from ait.fsm_importer import FsmImporter
+from ait.utils import dump_path
 from tests.common import SAMPLES
 
 
@@ -76,3 +77,16 @@ def test_eulerize():
 
     # THEN
     assert is_eulerian(state_graph.graph) == Eulerian.CIRCUIT
+
+
+def test_dump_path():
+    """test dump a path to string"""
+    # GIVEN
+    path = [Arrow("A", "B", "ab"), Arrow("B", "C", "bc")]
+
+    # WHEN
+    result = dump_path(path)
+
+    # THEN each arrow is in one line
+    assert result == "A--ab->B\nB--bc->C\n"
+    assert dump_path([]) == ""